@@ -3,6 +3,9 @@
 # This file only contains a selection of the most common options. For a full
 # list see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
+#
+# The Makefile builds in parallel (sphinx-build -j auto); all the extensions
+# below declare themselves parallel read and write safe.
 
 # -- Path setup --------------------------------------------------------------
 
@@ -36,19 +39,29 @@ extensions = [
     'sphinx.ext.autodoc',
     'sphinx.ext.autosummary',
     'sphinx.ext.todo',
-    'sphinx.ext.viewcode',
     'sphinx.ext.githubpages',
     'sphinx.ext.mathjax',
-    'numpydoc.numpydoc',
     # "nbsphinx",
+    # cheap unless BUILD_GALLERY=1, and needed to render the tracked auto_examples pages
     'sphinx_gallery.gen_gallery'
 ]
 
+# The heavier extensions can be skipped for quick rebuilds with `FULL_DOCS=0 make html`
+if os.environ.get('FULL_DOCS', '1') == '1':
+    extensions += [
+        'numpydoc.numpydoc',
+        'sphinx.ext.viewcode'
+    ]
+
 sphinx_gallery_conf = {
     # path to your examples scripts
     'examples_dirs' : './examples',
     # path where to save gallery generated examples
-    'gallery_dirs' : 'auto_examples'
+    'gallery_dirs' : 'auto_examples',
+    # only run the example scripts when explicitly requested, e.g. `BUILD_GALLERY=1 make html`
+    'plot_gallery' : os.environ.get('BUILD_GALLERY', '0') == '1',
+    # examples whose source matches the stored .md5 are not executed again
+    'run_stale_examples' : False
 }
 
 # # # Sphinx-nbexamples
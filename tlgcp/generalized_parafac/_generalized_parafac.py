@@ -3,7 +3,7 @@ from tensorly.decomposition._base_decomposition import DecompositionMixin
 import tensorly as tl
 from tensorly.cp_tensor import CPTensor, validate_cp_rank, unfolding_dot_khatri_rao
 import math
-from ..utils import lbfgs
+from ..utils import lbfgs, loss_operator, gradient_operator
 
 
 def vectorize_factors(factors):
@@ -109,8 +109,7 @@ def loss_operator_func(tensor, rank, loss):
     shape = tl.shape(tensor)
     size = tl.prod(tl.tensor(shape, **tl.context(tensor)))
     epsilon = 1e-8
-    # should we not create the reconstructed tensor here in advance? we sometimes recreate it twice in the losses, this seens like a waste of time?
-    # rec_tensor = vectorized_factors_to_tensor(x,shape,rank)
+    # see loss_and_gradient_operator_func to share one reconstructed tensor between the loss and the gradient
     if loss == 'gaussian':
         return lambda x: tl.sum((tensor - vectorized_factors_to_tensor(x, shape, rank)) ** 2) / size
     elif loss == 'bernoulli_odds':
@@ -170,6 +169,37 @@ def gradient_operator_func(tensor, rank, loss):
         raise ValueError('Loss "{}" not recognized'.format(loss))
 
 
+def loss_and_gradient_operator_func(tensor, rank, loss):
+    """
+    Operator returning both the loss and the gradient of generalized parafac decomposition, see [1]
+    for more details. The reconstructed tensor is computed once per call and shared by the loss and
+    the gradient, which is cheaper than calling the functions from `loss_operator_func` and
+    `gradient_operator_func` at the same point.
+
+    Parameters
+    ----------
+    tensor : ndarray
+    rank : int, rank of
+    loss : {'gaussian', 'gamma', 'rayleigh', 'poisson_count', 'poisson_log', 'bernoulli_odds', 'bernoulli_log'}
+
+    Returns
+    -------
+    function to calculate loss and gradient
+         Size based normalized loss and gradient for each entry
+    References
+    ----------
+    .. [1] Hong, D., Kolda, T. G., & Duersch, J. A. (2020).
+           Generalized canonical polyadic tensor decomposition. SIAM Review, 62(1), 133-163.
+    """
+    shape = tl.shape(tensor)
+
+    def loss_and_gradient(x):
+        rec_tensor = vectorized_factors_to_tensor(x, shape, rank)
+        return (tl.sum(loss_operator(tensor, rec_tensor, loss)),
+                vectorized_mttkrp(gradient_operator(tensor, rec_tensor, loss), x, rank))
+    return loss_and_gradient
+
+
 def initialize_generalized_parafac(tensor, rank, init='random', svd='numpy_svd', loss='gaussian', random_state=None):
     r"""Initialize factors used in `generalized parafac`.
 
@@ -273,7 +303,7 @@ def generalized_parafac(tensor, rank, n_iter_max=100, init='random', svd='numpy_
         Default : 'gaussian'
     fun_loss : callable, optional. You can use your own loss function here if its signature is (x: 1darray vectorized cp factors) and return a scalar value.
         Default :None
-    fun_gradient : callable, optional. Use this if you defined a custom loss function, this should map x to the gradient of the loss (1darray of size x.shape).
+    fun_gradient : callable, optional. Use this if you defined a custom loss function, this should map x to the gradient of the loss (1darray of size x.shape). Required with the numpy backend when using a custom loss.
         Default :None
 
     Returns
@@ -283,8 +313,8 @@ def generalized_parafac(tensor, rank, n_iter_max=100, init='random', svd='numpy_
           * all ones if normalize_factors is False (default)
           * weights of the (normalized) factors otherwise
         * factors : List of factors of the CP decomposition element `i` is of shape ``(tensor.shape[i], rank)``
-    errors : list
-        A list of reconstruction errors at each iteration of the algorithms.
+    errors : 1d ndarray
+        Reconstruction errors at each iteration of the algorithms.
     References
     ----------
     .. [1] Hong, D., Kolda, T. G., & Duersch, J. A. (2020).
@@ -306,12 +336,15 @@ def generalized_parafac(tensor, rank, n_iter_max=100, init='random', svd='numpy_
     else:
         non_negative = False
 
+    fun_loss_and_gradient = None
     if loss is not None:
         fun_loss = loss_operator_func(tensor, rank, loss=loss)
         fun_gradient = gradient_operator_func(tensor, rank, loss=loss)
+        fun_loss_and_gradient = loss_and_gradient_operator_func(tensor, rank, loss=loss)
 
     vectorized_factors, rec_errors = lbfgs(fun_loss, vectorized_factors, fun_gradient, n_iter_max=n_iter_max,
-                                           non_negative=non_negative, norm=norm)
+                                           non_negative=non_negative, norm=norm,
+                                           loss_and_gradient=fun_loss_and_gradient)
     _, factors = vectorized_factors_to_tensor(vectorized_factors, tl.shape(tensor), rank, return_factors=True)
 
     cp_tensor = CPTensor((weights, factors))
@@ -355,6 +388,7 @@ class GCP(DecompositionMixin):
     fun_loss : callable, optional
         Default :None
     fun_gradient : callable, optional
+        Required with the numpy backend when using a custom loss.
         Default :None
 
     Returns
@@ -365,8 +399,8 @@ class GCP(DecompositionMixin):
           * weights of the (normalized) factors otherwise
         * factors : List of factors of the CP decomposition element `i` is of shape ``(tensor.shape[i], rank)``
         * sparse_component : nD array of shape tensor.shape. Returns only if `sparsity` is not None.
-    errors : list
-        A list of reconstruction errors at each iteration of the algorithms.
+    errors : 1d ndarray
+        Reconstruction errors at each iteration of the algorithms.
     References
     ----------
     .. [1] Hong, D., Kolda, T. G., & Duersch, J. A. (2020).
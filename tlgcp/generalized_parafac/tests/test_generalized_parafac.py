@@ -1,6 +1,8 @@
 from .._generalized_parafac import (generalized_parafac, loss_operator_func, gradient_operator_func,
-                                    vectorize_factors, vectorized_factors_to_tensor, vectorized_mttkrp, GCP)
-from tensorly.testing import assert_, assert_array_equal, assert_class_wrapper_correctly_passes_arguments
+                                    loss_and_gradient_operator_func, vectorize_factors, vectorized_factors_to_tensor,
+                                    vectorized_mttkrp, GCP)
+from tensorly.testing import (assert_, assert_array_equal, assert_array_almost_equal,
+                              assert_class_wrapper_correctly_passes_arguments)
 from tensorly.cp_tensor import cp_to_tensor
 from tensorly.random import random_cp
 import tensorly as tl
@@ -24,6 +26,19 @@ def test_gradient_operator_func():
     assert_(callable(function) == True)
 
 
+def test_loss_and_gradient_operator_func():
+    """Test for the fused loss and gradient operator"""
+    shape = [8, 10, 6]
+    rank = 3
+    weights, factors = random_cp(shape, rank, normalise_factors=False)
+    tensor = tl.abs(cp_to_tensor(random_cp(shape, rank)))
+    vec_factors = tl.abs(vectorize_factors(factors))
+    for loss in ['gaussian', 'bernoulli_odds', 'bernoulli_logit', 'rayleigh', 'poisson_count', 'poisson_log', 'gamma']:
+        fun_loss, fun_gradient = loss_and_gradient_operator_func(tensor, rank, loss)(vec_factors)
+        assert_array_almost_equal(fun_loss, loss_operator_func(tensor, rank, loss)(vec_factors))
+        assert_array_almost_equal(fun_gradient, gradient_operator_func(tensor, rank, loss)(vec_factors))
+
+
 def test_vectorize_factors():
     """Test for the vectorized_factors
     """
@@ -148,3 +163,17 @@ def test_generalized_parafac(monkeypatch):
     assert_(error < tol_norm_2,
             f'norm 2 of reconstruction higher = {error} than tolerance={tol_norm_2}')
     assert_class_wrapper_correctly_passes_arguments(monkeypatch, generalized_parafac, GCP, rank=3)
+
+
+def test_generalized_parafac_large_norm():
+    """Test that the stopping criteria of Generalized Parafac do not depend on the norm of the tensor
+    """
+    tol_rel_error = 0.05
+    rank = 3
+    shape = [20, 20, 20]
+    rng = tl.check_random_state(1234)
+    tensor = 10 * cp_to_tensor(random_cp(shape, rank=rank, random_state=rng))
+    cp_tensor = generalized_parafac(tensor, loss='gaussian', rank=rank, init='random', random_state=rng)
+    error = tl.norm(tensor - cp_to_tensor(cp_tensor), 2) / tl.norm(tensor, 2)
+    assert_(error < tol_rel_error,
+            f'relative reconstruction error higher = {error} than tolerance={tol_rel_error}')
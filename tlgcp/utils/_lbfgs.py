@@ -1,9 +1,14 @@
 import tensorly as tl
-import scipy
+from scipy import __version__ as scipy_version
+from scipy.optimize import minimize, Bounds
 import numpy as np
 
+# SciPy >= 1.11 passes the current OptimizeResult, including the loss value, to the callback of minimize
+_CALLBACK_WITH_RESULT = tuple(int(v) for v in scipy_version.split('.')[:2]) >= (1, 11)
 
-def lbfgs(loss, x0, gradient=None, n_iter_max=100, non_negative=False, norm=1.0):
+
+def lbfgs(loss, x0, gradient=None, n_iter_max=100, non_negative=False, norm=1.0, maxcor=20,
+          ftol=2.220446049250313e-09, gtol=1e-05, maxfun=15000, maxls=20, loss_and_gradient=None):
     """
     LBFGS optimizer to solve GCP decomposition.
 
@@ -12,18 +17,42 @@ def lbfgs(loss, x0, gradient=None, n_iter_max=100, non_negative=False, norm=1.0)
     loss : callable
     x0 : 1d ndarray
     gradient : callable
+        Required by the numpy backend unless loss_and_gradient is given, other backends use automatic
+        differentiation.
         Default : None
     n_iter_max : int
         Default : 100
     non_negative : bool
         Default : False
     norm : float
+        The errors returned per iteration are the loss divided by norm. The optimization itself, including
+        the stopping criteria, is carried out on the unscaled loss.
         Default : 1.0
+    maxcor : int
+        Number of correction pairs kept in the limited memory approximation of the Hessian (numpy backend only).
+        Default : 20
+    ftol : float
+        The iterations stop when the relative reduction of the loss is below ftol (numpy backend only).
+        Default : 2.220446049250313e-09
+    gtol : float
+        The iterations stop when the largest projected gradient entry is below gtol (numpy backend only).
+        Default : 1e-05
+    maxfun : int
+        Maximum number of loss evaluations (numpy backend only).
+        Default : 15000
+    maxls : int
+        Maximum number of line search steps per iteration, lower values bound the number of loss and gradient
+        evaluations per iteration (numpy backend only).
+        Default : 20
+    loss_and_gradient : callable, optional
+        Returns the loss and its gradient at once, which lets both share intermediate results such as the
+        reconstructed tensor (numpy backend only). If None, loss and gradient are called separately.
+        Default : None
 
     Returns
     ----------
     ndarray
-    list of errors per iteration
+    1d ndarray of errors per iteration
 
     Notes
     --------
@@ -39,60 +68,119 @@ def lbfgs(loss, x0, gradient=None, n_iter_max=100, non_negative=False, norm=1.0)
     - mxnet: This issue can be followed. https://github.com/apache/incubator-mxnet/issues/9182
     """
 
-    if tl.get_backend() == "numpy":
-        from scipy.optimize import minimize
+    try:
+        backend_lbfgs = _BACKEND_LBFGS[tl.get_backend()]
+    except KeyError:
+        raise ValueError('LBFGS is not implemented for backend "{}"'.format(tl.get_backend())) from None
+    return backend_lbfgs(loss, x0, gradient=gradient, n_iter_max=n_iter_max, non_negative=non_negative, norm=norm,
+                         maxcor=maxcor, ftol=ftol, gtol=gtol, maxfun=maxfun, maxls=maxls,
+                         loss_and_gradient=loss_and_gradient)
+
+
+def _lbfgs_numpy(loss, x0, gradient=None, n_iter_max=100, non_negative=False, norm=1.0, maxcor=20,
+                 ftol=2.220446049250313e-09, gtol=1e-05, maxfun=15000, maxls=20, loss_and_gradient=None):
+    if gradient is None and loss_and_gradient is None:
+        # SciPy would otherwise use finite differences, i.e. one loss evaluation per entry of x0 for each gradient
+        raise ValueError("The numpy backend requires an analytic gradient, provide gradient or loss_and_gradient")
+    bound = Bounds(0, np.inf) if non_negative else None
+    # SciPy calls the callback once even when maxiter is 0
+    error = np.empty(n_iter_max + 1, dtype=np.float64)
+    n_errors = 0
+    inv_norm = 1.0 / norm
+    # With older SciPy the callback only gets x, keep the last loss value SciPy evaluated to feed it
+    cache = {}
+    if loss_and_gradient is None:
+        loss_and_gradient = lambda x: (loss(x), gradient(x))
+
+    def fun(x):
+        objective, grad = loss_and_gradient(x)
+        if not _CALLBACK_WITH_RESULT:
+            cache['x'], cache['objective'] = x.tobytes(), objective
+        return objective, grad
+
+    if _CALLBACK_WITH_RESULT:
+        def error_func(intermediate_result):
+            nonlocal n_errors
+            error[n_errors] = intermediate_result.fun * inv_norm
+            n_errors += 1
+    else:
+        def error_func(x):
+            nonlocal n_errors
+            if cache.get('x') == x.tobytes():
+                error[n_errors] = cache['objective'] * inv_norm
+            else:
+                error[n_errors] = loss(x) * inv_norm
+            n_errors += 1
+
+    result = minimize(fun, x0, method='L-BFGS-B', jac=True, callback=error_func,
+                      options={'maxiter': n_iter_max, 'maxcor': maxcor, 'ftol': ftol, 'gtol': gtol, 'maxfun': maxfun,
+                               'maxls': maxls},
+                      bounds=bound)
+    return result.x, error[:n_errors]
+
+
+def _lbfgs_pytorch(loss, x0, gradient=None, n_iter_max=100, non_negative=False, norm=1.0, **kwargs):
+    import torch
+    x0.requires_grad = True
+    optimizer = torch.optim.LBFGS([x0], history_size=10, max_iter=4, line_search_fn="strong_wolfe")
+    error = np.empty(n_iter_max, dtype=np.float64)
+
+    def closure():
+        # Zero gradients
+        optimizer.zero_grad()
+
+        # Compute loss
+        objective = loss(x0)
+
+        # Backward pass
+        objective.backward()
+
+        return objective
+
+    for i in range(n_iter_max):
+        # step returns the objective at the iterate it starts from, i.e. the one reached by the previous step
+        objective = optimizer.step(closure)
         if non_negative:
-            bound = scipy.optimize.Bounds(0, np.inf)
-        else:
-            bound = scipy.optimize.Bounds(-np.inf, np.inf)
-        error = []
-        error_func = lambda x: error.append(loss(x) / norm)
-        return minimize(loss, x0, method='L-BFGS-B', jac=gradient, callback=error_func, options={'maxiter': n_iter_max}, bounds=bound).x, error
-
-    elif tl.get_backend() == "pytorch":
-        import torch
-        x0.requires_grad = True
-        optimizer = torch.optim.LBFGS([x0], history_size=10, max_iter=4, line_search_fn="strong_wolfe")
-        error = []
-        for i in range(n_iter_max):
-            def closure():
-                # Zero gradients
-                optimizer.zero_grad()
-
-                # Compute loss
-                objective = loss(x0)
-
-                # Backward pass
-                objective.backward()
-
-                return objective
-
-            if non_negative:
-                with torch.no_grad():
-                    x0.clamp(min=0)
-            optimizer.step(closure)
-            objective = closure()
-            error.append(objective.item() / norm)
-        return x0, error
-
-    elif tl.get_backend() == "tensorflow":
-        import tensorflow_probability as tfp
-
-        def quadratic_loss_and_gradient(x):
-            return tfp.math.value_and_gradient(loss, x)
-        error = []
-        optim_results = tfp.optimizer.lbfgs_minimize(quadratic_loss_and_gradient,
-                                                         initial_position=x0,
-                                                         max_iterations=n_iter_max)
-        error.append(optim_results.objective_value / norm)
-        return optim_results.position, error
-
-    elif tl.get_backend() == "jax":
-        from jax.scipy.optimize import minimize
-        method = 'l-bfgs-experimental-do-not-rely-on-this'
-        error = []
-        result = minimize(loss, x0, method=method, options={'maxiter': n_iter_max})
-        return result.x, error
-
-    elif tl.get_backend() == "mxnet":
-        raise ValueError("There is no LBFGS method in Mxnet library")
+            x0.data.clamp_(min=0)
+        if i > 0:
+            error[i - 1] = objective.item() / norm
+    if n_iter_max > 0:
+        with torch.no_grad():
+            error[-1] = loss(x0).item() / norm
+    return x0, error
+
+
+def _lbfgs_tensorflow(loss, x0, gradient=None, n_iter_max=100, non_negative=False, norm=1.0, **kwargs):
+    import tensorflow as tf
+    import tensorflow_probability as tfp
+
+    # Compiled with XLA once, then reused by every evaluation of lbfgs_minimize
+    @tf.function(jit_compile=True)
+    def quadratic_loss_and_gradient(x):
+        return tfp.math.value_and_gradient(loss, x)
+    optim_results = tfp.optimizer.lbfgs_minimize(quadratic_loss_and_gradient,
+                                                 initial_position=x0,
+                                                 max_iterations=n_iter_max)
+    error = np.array([float(optim_results.objective_value) / norm])
+    return optim_results.position, error
+
+
+def _lbfgs_jax(loss, x0, gradient=None, n_iter_max=100, non_negative=False, norm=1.0, **kwargs):
+    import jax
+    from jax.scipy.optimize import minimize
+    method = 'l-bfgs-experimental-do-not-rely-on-this'
+    error = np.empty(0, dtype=np.float64)
+    # Compile the loss once so that the value and gradient traced by minimize are fused by XLA
+    result = minimize(jax.jit(loss), x0, method=method, options={'maxiter': n_iter_max})
+    return result.x, error
+
+
+def _lbfgs_mxnet(*args, **kwargs):
+    raise ValueError("There is no LBFGS method in Mxnet library")
+
+
+_BACKEND_LBFGS = {'numpy': _lbfgs_numpy,
+                  'pytorch': _lbfgs_pytorch,
+                  'tensorflow': _lbfgs_tensorflow,
+                  'jax': _lbfgs_jax,
+                  'mxnet': _lbfgs_mxnet}
@@ -1,7 +1,9 @@
 import tensorly as tl
 from tensorly.testing import assert_array_almost_equal
 from .._lbfgs import lbfgs
+from .. import _lbfgs
 import numpy as np
+import pytest
 
 def test_lbfgs():
     backends = ["numpy", "jax", "pytorch", "tensorflow"]
@@ -12,6 +14,68 @@ def test_lbfgs():
         b = tl.dot(a, true_res)
         x_init = tl.tensor(np.zeros([tl.shape(true_res)[0], tl.shape(true_res)[1]]))
         loss = lambda x: tl.sum((a @ tl.reshape(x, tl.shape(x_init)) - b)**2)
-        result, _ = lbfgs(loss, tl.tensor_to_vec(x_init))
+        gradient = lambda x: tl.tensor_to_vec(2 * tl.dot(tl.transpose(a), a @ tl.reshape(x, tl.shape(x_init)) - b))
+        result, _ = lbfgs(loss, tl.tensor_to_vec(x_init), gradient)
         result = tl.reshape(result, tl.shape(x_init))
         assert_array_almost_equal(true_res, result, decimal=2)
+
+
+def test_lbfgs_non_negative():
+    backends = ["numpy", "pytorch"]
+    for i in range(len(backends)):
+        tl.set_backend(backends[i])
+        a = tl.tensor(np.random.rand(10, 10))
+        b = -tl.dot(a, tl.tensor(np.random.rand(10, 10)))
+        x_init = tl.tensor(np.ones([10, 10]))
+        loss = lambda x: tl.sum((a @ tl.reshape(x, tl.shape(x_init)) - b)**2)
+        gradient = lambda x: tl.tensor_to_vec(2 * tl.dot(tl.transpose(a), a @ tl.reshape(x, tl.shape(x_init)) - b))
+        result, _ = lbfgs(loss, tl.tensor_to_vec(x_init), gradient, non_negative=True)
+        assert tl.all(result >= 0)
+
+
+def test_lbfgs_requires_gradient():
+    tl.set_backend("numpy")
+    loss = lambda x: tl.sum(x**2)
+    with pytest.raises(ValueError):
+        lbfgs(loss, tl.tensor(np.ones(10)))
+
+
+def test_lbfgs_no_iteration():
+    tl.set_backend("numpy")
+    loss = lambda x: tl.sum(x**2)
+    gradient = lambda x: 2 * x
+    x_init = tl.tensor(np.ones(10))
+    _, errors = lbfgs(loss, x_init, gradient, n_iter_max=0)
+    assert len(errors) <= 1
+
+
+def test_lbfgs_callback_without_result(monkeypatch):
+    tl.set_backend("numpy")
+    rng = np.random.RandomState(0)
+    a = tl.tensor(rng.rand(10, 10))
+    b = tl.dot(a, tl.tensor(rng.rand(10, 10)))
+    x_init = tl.tensor(np.zeros([10, 10]))
+    n_calls = [0]
+
+    def loss(x):
+        n_calls[0] += 1
+        return tl.sum((a @ tl.reshape(x, tl.shape(x_init)) - b)**2)
+    gradient = lambda x: tl.tensor_to_vec(2 * tl.dot(tl.transpose(a), a @ tl.reshape(x, tl.shape(x_init)) - b))
+
+    _, errors = lbfgs(loss, tl.tensor_to_vec(x_init), gradient)
+    calls = n_calls[0]
+
+    # the loss values cached from SciPy's evaluations are reused instead of calling loss again
+    monkeypatch.setattr(_lbfgs, "_CALLBACK_WITH_RESULT", False)
+    n_calls[0] = 0
+    _, errors_cached = lbfgs(loss, tl.tensor_to_vec(x_init), gradient)
+    assert n_calls[0] == calls
+    assert_array_almost_equal(errors, errors_cached)
+
+
+def test_lbfgs_unsupported_backend(monkeypatch):
+    tl.set_backend("numpy")
+    monkeypatch.delitem(_lbfgs._BACKEND_LBFGS, "numpy")
+    loss = lambda x: tl.sum(x**2)
+    with pytest.raises(ValueError):
+        lbfgs(loss, tl.tensor(np.ones(10)), lambda x: 2 * x)